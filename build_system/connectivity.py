@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Incremental connectivity tracking for Six Degrees builds
+
+Processes `master_words` in build order with a union-find (path compression +
+union by rank), reporting merges and isolated words at every
+`checkpointFrequency` words. State is saved so a resumed build only processes
+the words added since the last run.
+
+Connectivity here is undirected: a word is joined to its parent, children and
+acquaintances (the edges `find_path_bfs` follows) regardless of direction.
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(BUILD_DIR, '..', 'data', 'processed', 'master_words.json')
+DEFAULT_CONFIG = os.path.join(BUILD_DIR, 'config', 'full-run.json')
+DEFAULT_STATE = os.path.join(BUILD_DIR, '..', 'checkpoints', 'connectivity_checkpoint.json')
+
+
+class UnionFind:
+    """Disjoint sets over word names with path compression and union by rank"""
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.rank: Dict[str, int] = {}
+        self.size: Dict[str, int] = {}
+        self.components = 0
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.parent
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, word: str) -> None:
+        if word in self.parent:
+            return
+        self.parent[word] = word
+        self.rank[word] = 0
+        self.size[word] = 1
+        self.components += 1
+
+    def find(self, word: str) -> str:
+        root = word
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while self.parent[word] != root:
+            self.parent[word], word = root, self.parent[word]
+        return root
+
+    def union(self, a: str, b: str) -> bool:
+        """Merge the sets holding a and b; returns True if they were separate"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        del self.rank[root_b]
+        self.components -= 1
+        return True
+
+    def component_size(self, word: str) -> int:
+        return self.size[self.find(word)]
+
+    def component_sizes(self) -> List[int]:
+        """Sizes of all components, largest first"""
+        return sorted(self.size.values(), reverse=True)
+
+    def to_dict(self) -> dict:
+        return {'parent': self.parent, 'rank': self.rank, 'size': self.size}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> 'UnionFind':
+        uf = cls()
+        uf.parent = dict(state['parent'])
+        uf.rank = dict(state['rank'])
+        uf.size = dict(state['size'])
+        uf.components = len(uf.size)
+        return uf
+
+
+class ConnectivityTracker:
+    """Feeds build words into a UnionFind and keeps per-checkpoint reports"""
+
+    def __init__(self, checkpoint_frequency: int = 50):
+        self.checkpoint_frequency = checkpoint_frequency
+        self.uf = UnionFind()
+        # Edges whose target hasn't been added yet: target -> source words
+        self.pending: Dict[str, List[str]] = defaultdict(list)
+        self.batch: List[str] = []
+        self.batch_merges = 0
+        self.reports: List[dict] = []
+
+    @property
+    def processed(self) -> int:
+        return len(self.uf)
+
+    def add_word(self, entry: dict) -> None:
+        word = entry['word']
+        if word in self.uf:
+            return
+        self.uf.add(word)
+        self._link(word, entry)
+
+        for source in self.pending.pop(word, []):
+            self.batch_merges += self.uf.union(word, source)
+
+        self.batch.append(word)
+        if self.processed % self.checkpoint_frequency == 0:
+            self.checkpoint()
+
+    def refresh_word(self, entry: dict) -> None:
+        """Re-apply the current edges of an already-processed word
+
+        Later phases add edges to existing entries (phase 3 appends
+        acquaintances), so a resumed run re-links the words it already has.
+        Unions are idempotent; removed edges can't be undone by a union-find.
+        """
+        if entry['word'] in self.uf:
+            self._link(entry['word'], entry)
+
+    def _link(self, word: str, entry: dict) -> None:
+        neighbors = list(entry.get('children', [])) + list(entry.get('acquaintances', []))
+        if entry.get('parent'):
+            neighbors.append(entry['parent'])
+        for neighbor in neighbors:
+            if neighbor in self.uf:
+                self.batch_merges += self.uf.union(word, neighbor)
+            elif word not in self.pending[neighbor]:
+                self.pending[neighbor].append(word)
+
+    def checkpoint(self) -> Optional[dict]:
+        """Close the current batch and record a report for it"""
+        if not self.batch:
+            return None
+        sizes = self.uf.component_sizes()
+        report = {
+            'words_processed': self.processed,
+            'batch_size': len(self.batch),
+            'merges': self.batch_merges,
+            'components': self.uf.components,
+            'largest_component': sizes[0],
+            'isolated': [w for w in self.batch if self.uf.component_size(w) == 1],
+        }
+        self.reports.append(report)
+        self.batch = []
+        self.batch_merges = 0
+        return report
+
+    def is_connected(self) -> bool:
+        return self.uf.components == 1
+
+    def save(self, path: str) -> None:
+        state = {
+            'checkpoint_frequency': self.checkpoint_frequency,
+            'union_find': self.uf.to_dict(),
+            'pending': self.pending,
+            'batch': self.batch,
+            'batch_merges': self.batch_merges,
+        }
+        with open(path, 'w') as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'ConnectivityTracker':
+        with open(path, 'r') as f:
+            state = json.load(f)
+        tracker = cls(state['checkpoint_frequency'])
+        # JSON objects keep insertion order, so `parent` keys stay in build order
+        tracker.uf = UnionFind.from_dict(state['union_find'])
+        tracker.pending = defaultdict(list, state['pending'])
+        tracker.batch = state['batch']
+        tracker.batch_merges = state['batch_merges']
+        return tracker
+
+
+def load_build_words(filepath: str) -> List[dict]:
+    """Word entries in build order from master_words.json or a unified index"""
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    return list(data['master_words'].values())
+
+
+def resume_tracker(state_path: str, entries: List[dict],
+                   checkpoint_frequency: int) -> ConnectivityTracker:
+    """Reload saved state if it matches the start of this build, else start fresh
+
+    Words already in the saved state are re-linked with their current edges,
+    so edges added to them since the last run aren't lost.
+    """
+    if os.path.exists(state_path):
+        tracker = ConnectivityTracker.load(state_path)
+        saved = list(tracker.uf.parent)
+        if (tracker.checkpoint_frequency == checkpoint_frequency and
+                [e['word'] for e in entries[:len(saved)]] == saved):
+            for entry in entries[:len(saved)]:
+                tracker.refresh_word(entry)
+            return tracker
+        print("Saved connectivity state doesn't match this build, starting over")
+    return ConnectivityTracker(checkpoint_frequency)
+
+
+def track(entries: Iterable[dict], tracker: ConnectivityTracker) -> List[dict]:
+    """Add every not-yet-processed entry and return the new checkpoint reports"""
+    already = len(tracker.reports)
+    for entry in entries:
+        tracker.add_word(entry)
+    return tracker.reports[already:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Track graph connectivity as a build grows')
+    parser.add_argument('--input', default=DEFAULT_INPUT,
+                        help='master_words.json (or unified_master.json) to read')
+    parser.add_argument('--config', default=DEFAULT_CONFIG,
+                        help='build config providing checkpointFrequency')
+    parser.add_argument('--state', default=DEFAULT_STATE, help='where to persist tracker state')
+    parser.add_argument('--fresh', action='store_true', help='ignore any saved state')
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        checkpoint_frequency = json.load(f).get('checkpointFrequency', 50)
+
+    entries = load_build_words(args.input)
+    if args.fresh:
+        tracker = ConnectivityTracker(checkpoint_frequency)
+    else:
+        tracker = resume_tracker(args.state, entries, checkpoint_frequency)
+    resumed_at = tracker.processed
+
+    reports = track(entries[resumed_at:], tracker)
+    tracker.save(args.state)
+
+    print("=== CONNECTIVITY REPORT ===\n")
+    if resumed_at:
+        print(f"Resumed after {resumed_at} words")
+    print(f"Words processed: {tracker.processed} (checkpoint every {checkpoint_frequency})\n")
+
+    for report in reports:
+        print(f"Checkpoint @ {report['words_processed']} words: "
+              f"{report['merges']} merges, {report['components']} components, "
+              f"largest {report['largest_component']}")
+        if report['isolated']:
+            print(f"   Isolated: {', '.join(report['isolated'])}")
+
+    sizes = tracker.uf.component_sizes()
+    print(f"\nComponents: {tracker.uf.components} (sizes: {', '.join(map(str, sizes[:10]))}"
+          f"{', ...' if len(sizes) > 10 else ''})")
+    print(f"Graph is one connected component: {'yes' if tracker.is_connected() else 'no'}")
+    if tracker.batch:
+        print(f"{len(tracker.batch)} words since the last checkpoint")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 
-import json
+from test_paths import load_data
 from collections import defaultdict
 
 def detailed_analysis(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    data = load_data(file_path)
     
     master_words = data['master_words']
     
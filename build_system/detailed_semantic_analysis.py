@@ -1,13 +1,9 @@
 #!/usr/bin/env python3
 """Detailed semantic analysis of Six Degrees paths"""
 
-import json
 from typing import List, Dict, Tuple
 
-def load_data(filepath: str) -> dict:
-    """Load the unified master data"""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+from test_paths import load_data
 
 def analyze_semantic_logic(path: List[str], data: dict) -> Dict[str, any]:
     """Perform detailed semantic analysis of a path"""
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Export a compact, precomputed game bundle for the frontend
+
+The frontend currently loads the full pretty-printed unified index and runs
+BFS at startup to pick a puzzle. This stage turns the unified index into a
+minified bundle with:
+
+- an interned, sorted word table (edges refer to words by index)
+- CSR adjacency (offsets + targets) with a one-character edge type per edge
+- per-word display data (type, definition)
+- a sample of puzzle pairs with precomputed optimal distances (and optionally
+  paths), grouped by origin and delta-coded
+
+Path search mirrors `findOptimalPath` in App.jsx: it follows parent, children,
+traits, acquaintances and purposes, and never routes through `Thing`.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from shard_store import EXTRAS_FILE
+from test_paths import load_data
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+DEFAULT_INPUT = os.path.join(DATA_DIR, 'processed', 'unified_master.json')
+DEFAULT_OUTPUT = os.path.join(DATA_DIR, 'game_bundle.json')
+
+BUNDLE_VERSION = 1
+
+# (word field, edge type code); the order is the order edges are stored in
+EDGE_FIELDS = [
+    ('parent', 'p'),
+    ('children', 'c'),
+    ('traits', 't'),
+    ('acquaintances', 'a'),
+    ('purposes', 'r'),
+    ('exemplars', 'e'),
+    ('related_traits', 'l'),
+]
+
+# Edge types the player can walk along (exemplars/related_traits are display only)
+PATH_EDGE_TYPES = {'p', 'c', 't', 'a', 'r'}
+
+WORD_TYPES = ['thing', 'trait', 'role']
+
+SKIP_WORD = 'Thing'
+
+BASE36 = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+# Enough random puzzles for the frontend without outweighing the graph itself
+DEFAULT_MAX_PAIRS = 256
+
+
+def collect_words(data: dict) -> Dict[str, dict]:
+    """Merge thing, trait and role words the same way GameDataAdapter does"""
+    words = {}
+    for section in ('master_words', 'traits_master', 'roles_master', 'traits', 'roles'):
+        for key, entry in (data.get(section) or {}).items():
+            words[key] = entry
+    return words
+
+
+def build_csr(words: Dict[str, dict]) -> Tuple[List[str], List[int], List[int], str]:
+    """Intern the word table and build CSR adjacency with edge types"""
+    table = sorted(words)
+    index = {word: i for i, word in enumerate(table)}
+
+    offsets = [0]
+    targets = []
+    edge_types = []
+    for word in table:
+        entry = words[word]
+        for field, code in EDGE_FIELDS:
+            value = entry.get(field)
+            if not value:
+                continue
+            for neighbor in ([value] if isinstance(value, str) else value):
+                if neighbor in index:
+                    targets.append(index[neighbor])
+                    edge_types.append(code)
+        offsets.append(len(targets))
+
+    return table, offsets, targets, ''.join(edge_types)
+
+
+def bfs_from(source: int, offsets: List[int], targets: List[int], edge_types: str,
+             skip: Optional[int]) -> Tuple[List[int], List[int]]:
+    """Single-source BFS over walkable edges; returns (predecessors, distances)"""
+    prev = [-1] * (len(offsets) - 1)
+    dist = [-1] * (len(offsets) - 1)
+    prev[source] = source
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        for e in range(offsets[current], offsets[current + 1]):
+            if edge_types[e] not in PATH_EDGE_TYPES:
+                continue
+            nxt = targets[e]
+            if nxt == skip or prev[nxt] != -1:
+                continue
+            prev[nxt] = current
+            dist[nxt] = dist[current] + 1
+            queue.append(nxt)
+    return prev, dist
+
+
+def compute_puzzle_pairs(table: List[str], offsets: List[int], targets: List[int],
+                         edge_types: str, min_steps: int, max_steps: int,
+                         max_pairs: int, with_paths: bool) -> List[Tuple[int, int, int, List[int]]]:
+    """Pairs whose optimal path is within [min_steps, max_steps], sorted by (origin, destination)
+
+    Each pair is (origin, destination, steps, intermediate words), the last
+    being empty unless `with_paths` is set. With `max_pairs` set, a seeded
+    reservoir sample is kept while streaming, so memory stays O(max_pairs)
+    however many pairs qualify.
+    """
+    skip = table.index(SKIP_WORD) if SKIP_WORD in table else None
+    rng = random.Random(0)
+
+    kept: List[Tuple[int, int, int, List[int]]] = []
+    seen = 0
+    for source in range(len(table)):
+        if source == skip:
+            continue
+        prev, dist = bfs_from(source, offsets, targets, edge_types, skip)
+        for dest in range(len(table)):
+            steps = dist[dest]
+            if dest == source or dest == skip or not min_steps <= steps <= max_steps:
+                continue
+            seen += 1
+            if not max_pairs or len(kept) < max_pairs:
+                slot = len(kept)
+                kept.append(None)
+            else:
+                slot = rng.randrange(seen)
+                if slot >= max_pairs:
+                    continue
+
+            middle = []
+            if with_paths:
+                node = prev[dest]
+                while node != source:
+                    middle.append(node)
+                    node = prev[node]
+                middle.reverse()
+            kept[slot] = (source, dest, steps, middle)
+
+    kept.sort()
+    return kept
+
+
+def encode_puzzles(found: List[Tuple[int, int, int, List[int]]], min_steps: int,
+                   max_steps: int, with_paths: bool) -> dict:
+    """Group pairs by origin and delta-code word indexes
+
+    - `origins`: delta-coded origin indexes
+    - `counts`: number of pairs per origin
+    - `destinations`: per origin group, delta-coded destination indexes
+    - `steps`: one base-36 digit per pair
+    - `paths` (optional): intermediate words of every pair, `steps - 1` each
+    """
+    origins, counts, destinations, steps, paths = [], [], [], [], []
+    current_origin = None
+    last_origin = 0
+    last_dest = 0
+    for source, dest, length, middle in found:
+        if source != current_origin:
+            origins.append(source - last_origin)
+            counts.append(0)
+            current_origin = last_origin = source
+            last_dest = 0
+        counts[-1] += 1
+        destinations.append(dest - last_dest)
+        last_dest = dest
+        steps.append(BASE36[length])
+        paths.extend(middle)
+
+    puzzles = {
+        'minSteps': min_steps,
+        'maxSteps': max_steps,
+        'origins': origins,
+        'counts': counts,
+        'destinations': destinations,
+        'steps': ''.join(steps),
+    }
+    if with_paths:
+        puzzles['paths'] = paths
+    return puzzles
+
+
+def decode_puzzles(puzzles: dict) -> Iterator[Tuple[int, int, int]]:
+    """Yield (origin, destination, steps) from an encoded `puzzles` block"""
+    pair = 0
+    origin = 0
+    for origin_delta, count in zip(puzzles['origins'], puzzles['counts']):
+        origin += origin_delta
+        dest = 0
+        for _ in range(count):
+            dest += puzzles['destinations'][pair]
+            yield origin, dest, BASE36.index(puzzles['steps'][pair])
+            pair += 1
+
+
+def build_bundle(data: dict, min_steps: int = 4, max_steps: int = 6,
+                 max_pairs: int = DEFAULT_MAX_PAIRS, with_paths: bool = False) -> dict:
+    """Build the compact bundle dictionary from a unified index"""
+    if not 1 <= min_steps <= max_steps < len(BASE36):
+        raise ValueError(f"Step range must be within 1-{len(BASE36) - 1}: {min_steps}-{max_steps}")
+
+    words = collect_words(data)
+    table, offsets, targets, edge_types = build_csr(words)
+
+    types = [WORD_TYPES.index(words[w].get('type')) if words[w].get('type') in WORD_TYPES else 0
+             for w in table]
+    definitions = {str(i): words[w]['definition'] for i, w in enumerate(table)
+                   if words[w].get('definition')}
+
+    found = compute_puzzle_pairs(table, offsets, targets, edge_types,
+                                 min_steps, max_steps, max_pairs, with_paths)
+
+    return {
+        'version': BUNDLE_VERSION,
+        'buildInfo': data.get('buildInfo', {}),
+        'wordTypes': WORD_TYPES,
+        'edgeFields': [field for field, _ in EDGE_FIELDS],
+        'edgeCodes': ''.join(code for _, code in EDGE_FIELDS),
+        'words': table,
+        'types': types,
+        'definitions': definitions,
+        'offsets': offsets,
+        'targets': targets,
+        'edgeTypes': edge_types,
+        'puzzles': encode_puzzles(found, min_steps, max_steps, with_paths),
+    }
+
+
+def encode_bundle(bundle: dict) -> bytes:
+    """Minified JSON; keys are sorted so consecutive builds diff cleanly"""
+    return json.dumps(bundle, separators=(',', ':'), sort_keys=True,
+                      ensure_ascii=False).encode('utf-8')
+
+
+def format_size(num_bytes: int) -> str:
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    return f"{num_bytes / 1024:.1f} KB"
+
+
+def export_bundle(input_path: str, output_path: str, min_steps: int, max_steps: int,
+                  max_pairs: int, with_paths: bool) -> dict:
+    data = load_data(input_path)
+    bundle = build_bundle(data, min_steps, max_steps, max_pairs, with_paths)
+    encoded = encode_bundle(bundle)
+
+    with open(output_path, 'wb') as f:
+        f.write(encoded)
+
+    if os.path.isdir(input_path):
+        # Sharded store: the manifest's shard bytes plus the non-word data
+        manifest = data['master_words'].manifest
+        source_bytes = (sum(shard['bytes'] for shard in manifest['shards']) +
+                        os.path.getsize(os.path.join(input_path, EXTRAS_FILE)))
+        source_gzip_bytes = None
+    else:
+        with open(input_path, 'rb') as f:
+            source = f.read()
+        source_bytes = len(source)
+        source_gzip_bytes = len(gzip.compress(source))
+
+    return {
+        'words': len(bundle['words']),
+        'edges': len(bundle['targets']),
+        'pairs': len(bundle['puzzles']['steps']),
+        'source_bytes': source_bytes,
+        'source_gzip_bytes': source_gzip_bytes,
+        'bundle_bytes': len(encoded),
+        'bundle_gzip_bytes': len(gzip.compress(encoded)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export a compact game bundle for the frontend')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='unified_master.json (or sharded store directory) to read')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='bundle file to write')
+    parser.add_argument('--min-steps', type=int, default=4)
+    parser.add_argument('--max-steps', type=int, default=6)
+    parser.add_argument('--max-pairs', type=int, default=DEFAULT_MAX_PAIRS,
+                        help='cap on precomputed puzzle pairs (0 = no cap)')
+    parser.add_argument('--with-paths', action='store_true',
+                        help='also store the optimal path of every puzzle pair')
+    args = parser.parse_args()
+
+    report = export_bundle(args.input, args.output, args.min_steps, args.max_steps,
+                           args.max_pairs, args.with_paths)
+
+    print("=== GAME BUNDLE EXPORT ===\n")
+    print(f"Words: {report['words']}")
+    print(f"Edges: {report['edges']}")
+    print(f"Puzzle pairs ({args.min_steps}-{args.max_steps} steps): {report['pairs']}")
+    if report['source_gzip_bytes'] is None:
+        print(f"\nSource:  {format_size(report['source_bytes'])} (sharded store)")
+    else:
+        print(f"\nSource:  {format_size(report['source_bytes'])} "
+              f"({format_size(report['source_gzip_bytes'])} gzipped)")
+    print(f"Bundle:  {format_size(report['bundle_bytes'])} "
+          f"({format_size(report['bundle_gzip_bytes'])} gzipped)")
+    print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Per-word neighbourhood growth profiles for puzzle difficulty tuning
+
+For every word, counts how many words are reachable within 1, 2, 3... hops
+over the graph `find_path_bfs` walks (parent, children, acquaintances). A
+word whose reachable set grows slowly is a harder start or destination.
+
+Rather than one BFS per word, every word's reachable set is a Python int used
+as a bitset, and all of them expand together each hop:
+
+    reach_k[w] = reach_{k-1}[w] | OR(reach_{k-1}[n] for n in neighbors(w))
+
+so each hop costs one big-int OR per edge.
+"""
+
+import argparse
+import csv
+import os
+import time
+from typing import Dict, List
+
+from test_paths import build_adjacency, load_data
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+DEFAULT_INPUT = os.path.join(DATA_DIR, 'processed', 'unified_master.json')
+DEFAULT_OUTPUT = os.path.join(DATA_DIR, 'growth_profile.csv')
+
+# saturation_hop value for curves still growing at max_hops
+NOT_SATURATED = -1
+
+
+def growth_curves(adjacency: List[List[int]], max_hops: int = 10) -> List[List[int]]:
+    """curves[w][k - 1] = words reachable from w within k hops, excluding w
+
+    Stops early once no reachable set grows; curves are padded with their
+    final value up to `max_hops`.
+    """
+    reach = [1 << i for i in range(len(adjacency))]
+    curves: List[List[int]] = [[] for _ in adjacency]
+
+    for _ in range(max_hops):
+        grown = []
+        changed = False
+        for i, neighbors in enumerate(adjacency):
+            bits = reach[i]
+            for j in neighbors:
+                bits |= reach[j]
+            changed = changed or bits != reach[i]
+            grown.append(bits)
+        reach = grown
+        for i, bits in enumerate(reach):
+            curves[i].append(bits.bit_count() - 1)
+        if not changed:
+            break
+
+    for curve in curves:
+        curve.extend([curve[-1] if curve else 0] * (max_hops - len(curve)))
+    return curves
+
+
+def saturation_hop(curve: List[int]) -> int:
+    """Last hop that reached new words, i.e. the word's eccentricity
+
+    0 if nothing is reachable, and NOT_SATURATED if the curve was still growing
+    at its last hop, so it's unknown whether it would have stopped there.
+    """
+    if not curve or curve[-1] == 0:
+        return 0
+    for hop in range(1, len(curve)):
+        if curve[hop] == curve[hop - 1]:
+            return hop
+    return NOT_SATURATED
+
+
+def growth_profile(data: dict, max_hops: int = 10) -> Dict[str, List[int]]:
+    words, adjacency = build_adjacency(data)
+    return dict(zip(words, growth_curves(adjacency, max_hops)))
+
+
+def write_profile(profile: Dict[str, List[int]], output_path: str, max_hops: int) -> None:
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['word'] + [f"hop_{k}" for k in range(1, max_hops + 1)] +
+                        ['saturation_hop'])
+        for word, curve in profile.items():
+            writer.writerow([word] + curve + [saturation_hop(curve)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute k-hop growth curves for every word')
+    parser.add_argument('--input', default=DEFAULT_INPUT,
+                        help='unified_master.json (or sharded store directory)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='CSV table to write')
+    parser.add_argument('--max-hops', type=int, default=10)
+    args = parser.parse_args()
+
+    data = load_data(args.input)
+
+    started = time.perf_counter()
+    profile = growth_profile(data, args.max_hops)
+    elapsed = time.perf_counter() - started
+
+    write_profile(profile, args.output, args.max_hops)
+
+    print("=== NEIGHBOURHOOD GROWTH PROFILE ===\n")
+    print(f"Words: {len(profile)}, up to {args.max_hops} hops, computed in {elapsed:.3f}s")
+
+    if profile:
+        hop = min(2, args.max_hops)
+        ranked = sorted(profile.items(), key=lambda item: item[1][hop - 1])
+        print(f"\nSlowest growing (reachable within {hop} hops):")
+        for word, curve in ranked[:10]:
+            print(f"   {word}: {', '.join(map(str, curve[:5]))}")
+        print(f"\nFastest growing (reachable within {hop} hops):")
+        for word, curve in reversed(ranked[-10:]):
+            print(f"   {word}: {', '.join(map(str, curve[:5]))}")
+
+    print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
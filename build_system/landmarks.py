@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Landmark (ALT) distance oracle for the Six Degrees word graph
+
+Picks a handful of landmark words, stores BFS distances from and to each of
+them in compact arrays, and answers lower/upper bounds on the path length
+between any two words in O(#landmarks). Memory is 2 * #landmarks * #words
+unsigned shorts.
+
+The graph is the one `find_path_bfs` walks: directed edges to the parent,
+children and acquaintances of each word in `master_words`. The lower bounds
+double as an admissible, consistent A* heuristic (`find_path_astar`).
+"""
+
+import argparse
+import heapq
+import math
+import random
+import time
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from test_paths import build_adjacency, find_path_bfs, load_data
+
+UNREACHABLE = 0xFFFF
+
+DEFAULT_DIFFICULTY = {'easy': 4, 'normal': 6, 'hard': 8, 'expert': 10}
+
+
+def bfs_distances(source: int, adjacency: List[List[int]]) -> array:
+    """Hop counts from `source` along `adjacency`, UNREACHABLE where there's no path"""
+    dist = array('H', [UNREACHABLE]) * len(adjacency)
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        next_dist = dist[current] + 1
+        for nxt in adjacency[current]:
+            if dist[nxt] == UNREACHABLE:
+                dist[nxt] = next_dist
+                queue.append(nxt)
+    return dist
+
+
+class LandmarkOracle:
+    """Distance bounds between words from precomputed landmark distances"""
+
+    def __init__(self, data: dict, num_landmarks: int = 16, strategy: str = 'farthest'):
+        self.words, self.out_edges = build_adjacency(data)
+        self.index = {word: i for i, word in enumerate(self.words)}
+
+        self.in_edges: List[List[int]] = [[] for _ in self.words]
+        for i, neighbors in enumerate(self.out_edges):
+            for j in neighbors:
+                self.in_edges[j].append(i)
+
+        num_landmarks = min(num_landmarks, len(self.words))
+        if strategy == 'degree':
+            self.landmarks = self._select_by_degree(num_landmarks)
+            self.from_landmark = [bfs_distances(l, self.out_edges) for l in self.landmarks]
+            self.to_landmark = [bfs_distances(l, self.in_edges) for l in self.landmarks]
+        elif strategy == 'farthest':
+            self._select_farthest(num_landmarks)
+        else:
+            raise ValueError(f"Unknown landmark strategy: {strategy}")
+
+    def _degree(self, i: int) -> int:
+        return len(self.out_edges[i]) + len(self.in_edges[i])
+
+    def _select_by_degree(self, k: int) -> List[int]:
+        return sorted(range(len(self.words)), key=self._degree, reverse=True)[:k]
+
+    def _select_farthest(self, k: int) -> None:
+        """Farthest-point sampling, seeded with the highest-degree word
+
+        Words no landmark can reach (in either direction) count as infinitely
+        far, so every disconnected region gets a landmark before any region
+        gets a second one.
+        """
+        self.landmarks = []
+        self.from_landmark = []
+        self.to_landmark = []
+        nearest = [UNREACHABLE] * len(self.words)
+        candidate = max(range(len(self.words)), key=self._degree, default=None)
+        while candidate is not None and len(self.landmarks) < k:
+            self.landmarks.append(candidate)
+            forward = bfs_distances(candidate, self.out_edges)
+            backward = bfs_distances(candidate, self.in_edges)
+            self.from_landmark.append(forward)
+            self.to_landmark.append(backward)
+            for i in range(len(self.words)):
+                nearest[i] = min(nearest[i], forward[i], backward[i])
+            best = max(range(len(self.words)), key=lambda i: (nearest[i], self._degree(i)))
+            candidate = best if nearest[best] > 0 else None
+
+    def memory_bytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in self.from_landmark + self.to_landmark)
+
+    def bounds(self, start: str, end: str) -> Tuple[float, float]:
+        """(lower, upper) bounds on the shortest path length; math.inf if unbounded"""
+        s, t = self.index.get(start), self.index.get(end)
+        if s is None or t is None:
+            return math.inf, math.inf
+        return self._bounds(s, t)
+
+    def _bounds(self, s: int, t: int) -> Tuple[float, float]:
+        if s == t:
+            return 0, 0
+        lower = 0
+        upper = math.inf
+        for from_l, to_l in zip(self.from_landmark, self.to_landmark):
+            ls, lt, sl, tl = from_l[s], from_l[t], to_l[s], to_l[t]
+            if ls != UNREACHABLE:
+                # L reaches s; if L can't reach t then neither can s
+                if lt == UNREACHABLE:
+                    return math.inf, math.inf
+                lower = max(lower, lt - ls)
+            if tl != UNREACHABLE:
+                # t reaches L; if s can't reach L then s can't reach t
+                if sl == UNREACHABLE:
+                    return math.inf, math.inf
+                lower = max(lower, sl - tl)
+            if sl != UNREACHABLE and lt != UNREACHABLE:
+                upper = min(upper, sl + lt)
+        return lower, upper
+
+    def heuristic(self, end: str, start: Optional[str] = None, active: int = 4):
+        """A* heuristic for a fixed target: word index -> lower bound to `end`
+
+        With `start` given, only the `active` landmarks giving the best bound
+        for (start, end) are consulted, which keeps each evaluation cheap.
+        """
+        t = self.index[end]
+        terms = []
+        for from_l, to_l in zip(self.from_landmark, self.to_landmark):
+            lt, tl = from_l[t], to_l[t]
+            if lt != UNREACHABLE:
+                terms.append((from_l, lt, 1))
+            if tl != UNREACHABLE:
+                terms.append((to_l, tl, -1))
+
+        if start is not None and len(terms) > active:
+            s = self.index[start]
+            terms.sort(key=lambda term: (term[1] - term[0][s]) * term[2]
+                       if term[0][s] != UNREACHABLE else -1, reverse=True)
+            terms = terms[:active]
+
+        cache: Dict[int, int] = {}
+
+        def h(v: int) -> int:
+            if v in cache:
+                return cache[v]
+            best = 0
+            for dist, target_dist, sign in terms:
+                dv = dist[v]
+                if dv != UNREACHABLE:
+                    best = max(best, (target_dist - dv) * sign)
+            cache[v] = best
+            return best
+
+        return h
+
+    def difficulties(self, start: str, end: str,
+                     settings: Optional[Dict[str, int]] = None) -> List[str]:
+        """Difficulty levels whose target path length the pair could still have"""
+        settings = settings or DEFAULT_DIFFICULTY
+        lower, upper = self.bounds(start, end)
+        return [name for name, steps in settings.items() if lower <= steps <= upper]
+
+
+def find_path_astar(start: str, end: str, oracle: LandmarkOracle) -> Optional[List[str]]:
+    """Shortest path like `find_path_bfs`, guided by landmark lower bounds"""
+    if start not in oracle.index or end not in oracle.index:
+        return None
+    s, t = oracle.index[start], oracle.index[end]
+    if s == t:
+        return [start]
+    if oracle._bounds(s, t)[0] == math.inf:
+        return None
+
+    h = oracle.heuristic(end, start)
+    g = {s: 0}
+    prev = {s: s}
+    # Ties on f go to the deeper node, which reaches the target sooner
+    heap = [(h(s), 0, s)]
+    closed = set()
+    while heap:
+        _, depth, current = heapq.heappop(heap)
+        cost = -depth
+        if current in closed:
+            continue
+        if current == t:
+            path = [t]
+            while path[-1] != s:
+                path.append(prev[path[-1]])
+            return [oracle.words[i] for i in reversed(path)]
+        closed.add(current)
+        for nxt in oracle.out_edges[current]:
+            new_cost = cost + 1
+            if nxt not in closed and new_cost < g.get(nxt, math.inf):
+                g[nxt] = new_cost
+                prev[nxt] = current
+                heapq.heappush(heap, (new_cost + h(nxt), -new_cost, nxt))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a landmark distance oracle and check it')
+    parser.add_argument('input', help='unified_master.json (or sharded store directory)')
+    parser.add_argument('--landmarks', type=int, default=16)
+    parser.add_argument('--strategy', choices=['farthest', 'degree'], default='farthest')
+    parser.add_argument('--samples', type=int, default=500, help='random pairs to check')
+    args = parser.parse_args()
+
+    data = load_data(args.input)
+    settings = data.get('game_config', {}).get('difficulty_settings') or DEFAULT_DIFFICULTY
+
+    started = time.perf_counter()
+    oracle = LandmarkOracle(data, args.landmarks, args.strategy)
+    build_time = time.perf_counter() - started
+
+    print("=== LANDMARK ORACLE ===\n")
+    print(f"Words: {len(oracle.words)}")
+    print(f"Landmarks ({args.strategy}): {', '.join(oracle.words[l] for l in oracle.landmarks)}")
+    print(f"Distance arrays: {oracle.memory_bytes()} bytes, built in {build_time:.3f}s")
+
+    rng = random.Random(0)
+    pairs = [(rng.choice(oracle.words), rng.choice(oracle.words)) for _ in range(args.samples)]
+
+    exact = 0
+    reachable = 0
+    bfs_time = astar_time = 0.0
+    for start, end in pairs:
+        lower, upper = oracle.bounds(start, end)
+
+        started = time.perf_counter()
+        bfs_path = find_path_bfs(start, end, data)
+        bfs_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        astar_path = find_path_astar(start, end, oracle)
+        astar_time += time.perf_counter() - started
+
+        if (bfs_path is None) != (astar_path is None) or \
+                (bfs_path and len(bfs_path) != len(astar_path)):
+            print(f"   MISMATCH {start} → {end}: BFS {bfs_path}, A* {astar_path}")
+        if bfs_path:
+            reachable += 1
+            distance = len(bfs_path) - 1
+            if not lower <= distance <= upper:
+                print(f"   BAD BOUNDS {start} → {end}: {lower} <= {distance} <= {upper}")
+            exact += lower == upper
+
+    print(f"\nChecked {len(pairs)} random pairs ({reachable} reachable)")
+    if reachable:
+        print(f"   Bounds exact for {exact} ({100 * exact / reachable:.1f}%) of reachable pairs")
+    print(f"   find_path_bfs: {bfs_time * 1000:.1f} ms total")
+    print(f"   find_path_astar: {astar_time * 1000:.1f} ms total")
+
+    counts = {name: 0 for name in settings}
+    for start, end in pairs:
+        for name in oracle.difficulties(start, end, settings):
+            counts[name] += 1
+    print("\nPairs that could match each difficulty:")
+    for name, steps in settings.items():
+        print(f"   {name} ({steps} steps): {counts[name]}")
+
+
+if __name__ == "__main__":
+    main()
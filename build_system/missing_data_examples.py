@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 
-import json
+from test_paths import load_data
 
 def show_missing_examples(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    data = load_data(file_path)
     
     master_words = data['master_words']
     
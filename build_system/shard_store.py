@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Sharded, lazily loaded storage for very large word graphs
+
+Splits `master_words` into shards, either by top-level subtree (the children of
+`Thing`) or by hash of the word, and writes:
+
+    manifest.json        strategy, shard list, word counts and byte sizes
+    extras.json          every other top-level key (traits_master, stats, ...)
+    shard_NNN.jsonl      one word entry per line
+    shard_NNN.idx.json   {word: [byte offset, byte length]} for that shard
+    shard_map.bin        sorted CRC32 word hashes and their shard numbers, so a
+                         lookup reads at most one offset index
+
+`ShardedWords` exposes the shards through the usual mapping interface, loading
+a shard on first access and evicting the least recently used ones once the
+memory cap is exceeded, so `find_path_bfs` and the analyzers work on it as-is:
+
+    data = load_sharded('data/shards')
+    find_path_bfs('Cat', 'Theory', data)
+"""
+
+import argparse
+import json
+import os
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MANIFEST_FILE = 'manifest.json'
+EXTRAS_FILE = 'extras.json'
+SHARD_MAP_FILE = 'shard_map.bin'
+MANIFEST_VERSION = 2
+
+ROOT_WORD = 'Thing'
+MISC_SHARD = 'misc'
+
+DEFAULT_MEMORY_CAP_MB = 64
+
+# Parsed-size / on-disk-size guess used until a shard has been measured; json
+# entries typically expand about 8x once loaded, so this errs on the high side
+DEFAULT_EXPANSION = 10.0
+
+
+def word_hash(word: str) -> int:
+    """Stable across runs and platforms (unlike the built-in hash)"""
+    return zlib.crc32(word.encode('utf-8'))
+
+
+def hash_shard(word: str, num_shards: int) -> int:
+    return word_hash(word) % num_shards
+
+
+def write_shard_map(path: str, shard_words: List[List[str]]) -> None:
+    """Sorted word hashes followed by the matching shard numbers, as raw arrays"""
+    pairs = sorted((word_hash(word), shard) for shard, words in enumerate(shard_words)
+                   for word in words)
+    with open(path, 'wb') as f:
+        array('I', [h for h, _ in pairs]).tofile(f)
+        array('H', [shard for _, shard in pairs]).tofile(f)
+
+
+def read_shard_map(path: str, total_words: int) -> Tuple[array, array]:
+    hashes, shards = array('I'), array('H')
+    with open(path, 'rb') as f:
+        hashes.fromfile(f, total_words)
+        shards.fromfile(f, total_words)
+    return hashes, shards
+
+
+def subtree_of(word: str, master_words: dict, cache: Dict[str, str]) -> str:
+    """Name of the child of Thing that `word` descends from, or MISC_SHARD"""
+    chain = []
+    current = word
+    result = MISC_SHARD
+    while current is not None:
+        if current in cache:
+            result = cache[current]
+            break
+        if current in chain or current not in master_words:
+            break
+        chain.append(current)
+        parent = master_words[current].get('parent')
+        if parent == ROOT_WORD:
+            result = current
+            break
+        current = parent
+    for visited in chain:
+        cache[visited] = result
+    return result
+
+
+def assign_shards(master_words: dict, strategy: str, num_shards: int) -> Dict[str, List[str]]:
+    """Group words into named shards, keeping each shard in build order"""
+    shards: Dict[str, List[str]] = OrderedDict()
+    if strategy == 'hash':
+        for i in range(num_shards):
+            shards[f"{i:03d}"] = []
+        for word in master_words:
+            shards[f"{hash_shard(word, num_shards):03d}"].append(word)
+    else:
+        root = master_words.get(ROOT_WORD, {})
+        for child in root.get('children', []):
+            shards[child] = []
+        shards[MISC_SHARD] = []
+        cache: Dict[str, str] = {}
+        for word in master_words:
+            shards.setdefault(subtree_of(word, master_words, cache), []).append(word)
+    return OrderedDict((name, words) for name, words in shards.items() if words)
+
+
+def write_shards(data: dict, out_dir: str, strategy: str = 'subtree',
+                 num_shards: int = 16) -> dict:
+    """Write `data` as a sharded store in `out_dir` and return the manifest"""
+    if strategy not in ('subtree', 'hash'):
+        raise ValueError(f"Unknown shard strategy: {strategy}")
+    os.makedirs(out_dir, exist_ok=True)
+    master_words = data['master_words']
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'strategy': strategy,
+        'num_shards': num_shards if strategy == 'hash' else None,
+        'total_words': len(master_words),
+        'shards': [],
+    }
+
+    assigned = assign_shards(master_words, strategy, num_shards)
+    for i, (name, words) in enumerate(assigned.items()):
+        shard_file = f"shard_{i:03d}.jsonl"
+        index_file = f"shard_{i:03d}.idx.json"
+        index = {}
+        offset = 0
+        with open(os.path.join(out_dir, shard_file), 'wb') as f:
+            for word in words:
+                line = json.dumps(master_words[word], ensure_ascii=False).encode('utf-8') + b'\n'
+                f.write(line)
+                index[word] = [offset, len(line)]
+                offset += len(line)
+        with open(os.path.join(out_dir, index_file), 'w') as f:
+            json.dump(index, f, ensure_ascii=False)
+        manifest['shards'].append({
+            'name': name,
+            'file': shard_file,
+            'index': index_file,
+            'words': len(words),
+            'bytes': offset,
+        })
+
+    write_shard_map(os.path.join(out_dir, SHARD_MAP_FILE), list(assigned.values()))
+    manifest['shard_map'] = SHARD_MAP_FILE
+
+    extras = {key: value for key, value in data.items() if key != 'master_words'}
+    with open(os.path.join(out_dir, EXTRAS_FILE), 'w') as f:
+        json.dump(extras, f, ensure_ascii=False)
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def deep_size(obj) -> int:
+    """Recursive sys.getsizeof over the dict/list/str/int trees json.load produces
+
+    Shared objects are counted once per reference, so this errs on the high side.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k) + deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item) for item in obj)
+    return size
+
+
+class ShardedWords(Mapping):
+    """Read-only `master_words` mapping backed by lazily loaded shards
+
+    Shard payloads and offset indexes share one LRU cache. Its size is the
+    estimated in-memory size of the parsed objects, kept under `memory_cap_mb`
+    together with the always-resident shard map. A shard whose parsed size
+    would not fit is never held whole; its entries are read one by one through
+    the offset index instead. The most recently used item always stays, so an
+    offset index larger than the cap on its own can still exceed it.
+    """
+
+    def __init__(self, directory: str, memory_cap_mb: float = DEFAULT_MEMORY_CAP_MB):
+        self.directory = directory
+        self.memory_cap = int(memory_cap_mb * 1024 * 1024)
+        with open(os.path.join(directory, MANIFEST_FILE), 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported shard store version in {directory}; rewrite it "
+                             f"with shard_store.py")
+        self.shards = self.manifest['shards']
+
+        self._map_hashes, self._map_shards = read_shard_map(
+            os.path.join(directory, self.manifest['shard_map']), self.manifest['total_words'])
+        self._pinned_bytes = (self._map_hashes.itemsize * len(self._map_hashes) +
+                              self._map_shards.itemsize * len(self._map_shards))
+
+        # ('index' | 'shard', shard number) -> (parsed object, estimated bytes)
+        self._cache: 'OrderedDict[Tuple[str, int], Tuple[dict, int]]' = OrderedDict()
+        self._cached_bytes = 0
+        # In-memory bytes per on-disk byte, measured on the last shard loaded
+        self._expansion = DEFAULT_EXPANSION
+        # Shards found too large to hold whole; always read entry by entry
+        self._oversized = set()
+        self.loads = 0
+        self.index_loads = 0
+        self.evictions = 0
+
+    @property
+    def _budget(self) -> int:
+        return self.memory_cap - self._pinned_bytes
+
+    def _cached(self, key: Tuple[str, int]) -> Optional[dict]:
+        if key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key][0]
+
+    def _remember(self, key: Tuple[str, int], value: dict, size: Optional[int] = None) -> int:
+        if size is None:
+            size = deep_size(value)
+        self._cache[key] = (value, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self._budget and len(self._cache) > 1:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._cached_bytes -= evicted_size
+            self.evictions += 1
+        return size
+
+    def _index(self, shard: int) -> Dict[str, List[int]]:
+        index = self._cached(('index', shard))
+        if index is None:
+            path = os.path.join(self.directory, self.shards[shard]['index'])
+            with open(path, 'r') as f:
+                index = json.load(f)
+            self.index_loads += 1
+            self._remember(('index', shard), index)
+        return index
+
+    def _candidates(self, word: str) -> List[int]:
+        """Shards whose words share `word`'s hash (almost always zero or one)"""
+        h = word_hash(word)
+        i = bisect_left(self._map_hashes, h)
+        found = []
+        while i < len(self._map_hashes) and self._map_hashes[i] == h:
+            found.append(self._map_shards[i])
+            i += 1
+        return found
+
+    def _locate(self, word: str) -> Optional[int]:
+        """Shard number holding `word`; reads at most one index per hash candidate"""
+        for shard in self._candidates(word):
+            entries = self._cached(('shard', shard))
+            if word in (entries if entries is not None else self._index(shard)):
+                return shard
+        return None
+
+    def _read_entry(self, shard: int, word: str) -> dict:
+        """Read one entry by offset without loading the whole shard"""
+        offset, length = self._index(shard)[word]
+        with open(os.path.join(self.directory, self.shards[shard]['file']), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def _load(self, shard: int) -> Optional[Dict[str, dict]]:
+        """Parse a whole shard, or return None once it grows past the budget"""
+        entries = self._cached(('shard', shard))
+        if entries is not None:
+            return entries
+
+        entries = {}
+        size = sys.getsizeof(entries)
+        with open(os.path.join(self.directory, self.shards[shard]['file']), 'rb') as f:
+            for word, line in zip(self._index(shard), f):
+                entry = json.loads(line)
+                entries[word] = entry
+                size += deep_size(word) + deep_size(entry)
+                if size > self._budget:
+                    self._oversized.add(shard)
+                    return None
+        self.loads += 1
+
+        self._remember(('shard', shard), entries, size)
+        if self.shards[shard]['bytes']:
+            self._expansion = size / self.shards[shard]['bytes']
+        return entries
+
+    def __getitem__(self, word: str) -> dict:
+        shard = self._locate(word)
+        if shard is None:
+            raise KeyError(word)
+        if ('shard', shard) not in self._cache and (
+                shard in self._oversized or
+                self.shards[shard]['bytes'] * self._expansion > self._budget):
+            return self._read_entry(shard, word)
+        entries = self._load(shard)
+        if entries is None:
+            return self._read_entry(shard, word)
+        return entries[word]
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._locate(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        # Shard by shard, so a full items() scan loads each shard once
+        for i in range(len(self.shards)):
+            yield from self._index(i)
+
+    def __len__(self) -> int:
+        return self.manifest['total_words']
+
+    def memory_usage(self) -> int:
+        """Estimated in-memory bytes of the shard map, payloads and indexes held"""
+        return self._pinned_bytes + self._cached_bytes
+
+
+def is_sharded(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def load_sharded(directory: str, memory_cap_mb: float = DEFAULT_MEMORY_CAP_MB) -> dict:
+    """Same shape as a loaded unified_master.json, with lazy `master_words`"""
+    with open(os.path.join(directory, EXTRAS_FILE), 'r') as f:
+        data = json.load(f)
+    data['master_words'] = ShardedWords(directory, memory_cap_mb)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert a unified index into a sharded store')
+    parser.add_argument('input', help='unified_master.json to shard')
+    parser.add_argument('output', help='directory to write shards into')
+    parser.add_argument('--strategy', choices=['subtree', 'hash'], default='subtree')
+    parser.add_argument('--shards', type=int, default=16, help='shard count for --strategy hash')
+    args = parser.parse_args()
+
+    with open(args.input, 'r') as f:
+        data = json.load(f)
+    manifest = write_shards(data, args.output, args.strategy, args.shards)
+
+    print(f"Wrote {manifest['total_words']} words into {len(manifest['shards'])} shards "
+          f"({manifest['strategy']}) at {args.output}")
+    for shard in manifest['shards']:
+        print(f"   {shard['file']}  {shard['name']}: {shard['words']} words, {shard['bytes']} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,15 @@
 """Test semantic paths in Six Degrees game data"""
 
 import json
+import os
 from collections import deque
 from typing import List, Optional, Dict, Tuple, Set
 
 def load_data(filepath: str) -> dict:
-    """Load the unified master data"""
+    """Load the unified master data (a JSON file or a sharded store directory)"""
+    if os.path.isdir(filepath):
+        from shard_store import load_sharded
+        return load_sharded(filepath)
     with open(filepath, 'r') as f:
         return json.load(f)
 
@@ -27,6 +31,20 @@ def find_all_connections(word: str, data: dict) -> Set[str]:
     
     return connections
 
+def build_adjacency(data: dict) -> Tuple[List[str], List[List[int]]]:
+    """Index the graph find_path_bfs walks: word list plus out-neighbor indexes per word
+
+    Connections to words outside master_words are dropped; they have no
+    connections of their own, so they never lie on a path between two words.
+    """
+    words = list(data['master_words'])
+    index = {word: i for i, word in enumerate(words)}
+    adjacency = []
+    for i, word in enumerate(words):
+        neighbors = (index.get(n) for n in find_all_connections(word, data))
+        adjacency.append(sorted(j for j in neighbors if j is not None and j != i))
+    return words, adjacency
+
 def find_path_bfs(start: str, end: str, data: dict) -> Optional[List[str]]:
     """Find shortest path between two words using BFS"""
     if start not in data['master_words'] or end not in data['master_words']:
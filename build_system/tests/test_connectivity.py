@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from connectivity import ConnectivityTracker, resume_tracker, track  # noqa: E402
+
+
+def test_resume_picks_up_edges_added_to_saved_words(tmp_path):
+    before = [
+        {'word': 'A', 'parent': None, 'children': [], 'acquaintances': []},
+        {'word': 'B', 'parent': None, 'children': [], 'acquaintances': []},
+    ]
+    # A later phase gave A an acquaintance and a child
+    after = [
+        {'word': 'A', 'parent': None, 'children': ['C'], 'acquaintances': ['B']},
+        {'word': 'B', 'parent': None, 'children': [], 'acquaintances': []},
+        {'word': 'C', 'parent': 'A', 'children': [], 'acquaintances': []},
+    ]
+
+    state_path = str(tmp_path / 'state.json')
+    first = ConnectivityTracker(2)
+    track(before, first)
+    first.save(state_path)
+
+    resumed = resume_tracker(state_path, after, 2)
+    assert resumed.processed == 2
+    track(after[resumed.processed:], resumed)
+
+    fresh = ConnectivityTracker(2)
+    track(after, fresh)
+
+    assert resumed.uf.component_sizes() == fresh.uf.component_sizes() == [3]
+    assert resumed.is_connected()
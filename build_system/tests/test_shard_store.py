@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from shard_store import ShardedWords, deep_size, write_shards  # noqa: E402
+
+
+def synthetic_data(words_per_subtree: int = 15000) -> dict:
+    """Two subtrees under Thing, each a flat list of leaves"""
+    master_words = {'Thing': {'word': 'Thing', 'parent': None, 'children': ['Left', 'Right']}}
+    for side in ('Left', 'Right'):
+        leaves = [f"{side}{i}" for i in range(words_per_subtree)]
+        master_words[side] = {'word': side, 'parent': 'Thing', 'children': leaves}
+        for leaf in leaves:
+            master_words[leaf] = {'word': leaf, 'parent': side, 'children': [],
+                                  'acquaintances': [], 'definition': f"A {side.lower()} leaf"}
+    return {'master_words': master_words}
+
+
+def test_lookups_read_at_most_one_index(tmp_path):
+    write_shards(synthetic_data(), str(tmp_path), 'subtree')
+    words = ShardedWords(str(tmp_path), memory_cap_mb=4)
+
+    for i in range(200):
+        assert f"Missing{i}" not in words
+        assert words[f"Right{i * 50}"]['parent'] == 'Right'
+
+    # Missing words never reach an index; the Right shard's index stays cached
+    assert words.index_loads <= 2
+    assert words.memory_usage() <= words.memory_cap
+
+
+def test_first_load_respects_cap(tmp_path):
+    data = synthetic_data()
+    write_shards(data, str(tmp_path), 'subtree')
+    words = ShardedWords(str(tmp_path), memory_cap_mb=4)
+
+    parsed = deep_size({w: e for w, e in data['master_words'].items() if w.startswith('Left')})
+    assert parsed > words.memory_cap
+
+    assert words['Left7']['definition'] == 'A left leaf'
+    assert words.loads == 0
+    assert words.memory_usage() <= words.memory_cap
+
+    # Even when the size estimate is badly off, parsing stops at the cap
+    words = ShardedWords(str(tmp_path), memory_cap_mb=4)
+    words._expansion = 1.0
+    assert words['Left7']['definition'] == 'A left leaf'
+    assert words['Left8']['definition'] == 'A left leaf'
+    assert words.loads == 0
+    assert words.memory_usage() <= words.memory_cap
+
+
+def test_small_shards_load_whole(tmp_path):
+    write_shards(synthetic_data(100), str(tmp_path), 'hash', num_shards=4)
+    words = ShardedWords(str(tmp_path))
+
+    assert dict(words.items()).keys() == synthetic_data(100)['master_words'].keys()
+    assert words.loads == 4
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""SQLite-backed query layer over master_words
+
+Imports a build (and optionally every archived build) into a local SQLite
+database once, so reports can use indexed queries instead of re-scanning the
+whole JSON each time:
+
+    db = WordDB()
+    db.import_build('../data/processed/unified_master.json')
+    db.import_archive()
+    db.words_without_traits('processed', parent='Animal')
+    db.words_by_stages('processed', done=['rawLogged'], not_done=['rolesPromoted'])
+    db.word_history('Cat')
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+DEFAULT_DB = os.path.join(DATA_DIR, 'word_graph.sqlite')
+DEFAULT_BUILD = os.path.join(DATA_DIR, 'processed', 'unified_master.json')
+ARCHIVE_DIR = os.path.join(DATA_DIR, 'archive')
+
+# Preferred data file inside an archived build directory, in order
+ARCHIVE_FILES = ['unified_master.json', 'master_words.json']
+
+# Edge kinds stored in `edges`, keyed by the word field they come from
+EDGE_FIELDS = {
+    'parent': 'parent',
+    'children': 'child',
+    'acquaintances': 'acquaintance',
+    'purposes': 'purpose',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL UNIQUE,
+    source      TEXT NOT NULL,
+    imported_at TEXT NOT NULL,
+    word_count  INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS words (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    word     TEXT NOT NULL,
+    type     TEXT,
+    parent   TEXT,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (build_id, word)
+);
+CREATE TABLE IF NOT EXISTS edges (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    src      TEXT NOT NULL,
+    dst      TEXT NOT NULL,
+    kind     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    word     TEXT NOT NULL,
+    stage    TEXT NOT NULL,
+    done     INTEGER NOT NULL,
+    PRIMARY KEY (build_id, word, stage)
+);
+CREATE TABLE IF NOT EXISTS traits (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    word     TEXT NOT NULL,
+    trait    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_words_parent ON words(build_id, parent);
+CREATE INDEX IF NOT EXISTS idx_words_name ON words(word);
+CREATE INDEX IF NOT EXISTS idx_edges_src ON edges(build_id, src, kind);
+CREATE INDEX IF NOT EXISTS idx_edges_dst ON edges(build_id, dst, kind);
+CREATE INDEX IF NOT EXISTS idx_edges_kind ON edges(build_id, kind, src);
+CREATE INDEX IF NOT EXISTS idx_stages_stage ON stages(build_id, stage, done);
+CREATE INDEX IF NOT EXISTS idx_traits_word ON traits(build_id, word);
+CREATE INDEX IF NOT EXISTS idx_traits_trait ON traits(build_id, trait);
+"""
+
+
+def read_build_words(filepath: str) -> List[dict]:
+    """Word entries from master_words.json (a list) or a unified index (a dict)"""
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    return [dict(entry, word=entry.get('word', key)) for key, entry in data['master_words'].items()]
+
+
+class WordDB:
+    """Import builds into SQLite and answer indexed queries about them"""
+
+    def __init__(self, path: str = DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'WordDB':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Import -------------------------------------------------------------
+
+    def import_build(self, filepath: str, name: Optional[str] = None) -> int:
+        """Load one build, replacing any earlier import under the same name"""
+        if name is None:
+            name = os.path.basename(os.path.dirname(os.path.abspath(filepath)))
+        entries = read_build_words(filepath)
+
+        with self.conn:
+            self.conn.execute('DELETE FROM builds WHERE name = ?', (name,))
+            cur = self.conn.execute(
+                'INSERT INTO builds (name, source, imported_at, word_count) VALUES (?, ?, ?, ?)',
+                (name, os.path.abspath(filepath), datetime.now().isoformat(timespec='seconds'),
+                 len(entries)))
+            build_id = cur.lastrowid
+
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO words (build_id, word, type, parent, position) '
+                'VALUES (?, ?, ?, ?, ?)',
+                ((build_id, e['word'], e.get('type'), e.get('parent'), i)
+                 for i, e in enumerate(entries)))
+            self.conn.executemany(
+                'INSERT INTO edges (build_id, src, dst, kind) VALUES (?, ?, ?, ?)',
+                ((build_id, e['word'], dst, kind)
+                 for e in entries for field, kind in EDGE_FIELDS.items()
+                 for dst in self._as_list(e.get(field))))
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO stages (build_id, word, stage, done) VALUES (?, ?, ?, ?)',
+                ((build_id, e['word'], stage, int(bool(done)))
+                 for e in entries for stage, done in (e.get('stages') or {}).items()))
+            self.conn.executemany(
+                'INSERT INTO traits (build_id, word, trait) VALUES (?, ?, ?)',
+                ((build_id, e['word'], trait) for e in entries for trait in e.get('traits') or []))
+        return build_id
+
+    def import_archive(self, archive_dir: str = ARCHIVE_DIR) -> List[str]:
+        """Import every archived build; returns the imported build names"""
+        imported = []
+        for name in sorted(os.listdir(archive_dir)):
+            for filename in ARCHIVE_FILES:
+                filepath = os.path.join(archive_dir, name, filename)
+                if os.path.isfile(filepath):
+                    self.import_build(filepath, name)
+                    imported.append(name)
+                    break
+        return imported
+
+    @staticmethod
+    def _as_list(value) -> List[str]:
+        if not value:
+            return []
+        return [value] if isinstance(value, str) else list(value)
+
+    # --- Queries ------------------------------------------------------------
+
+    def builds(self) -> List[Dict]:
+        rows = self.conn.execute(
+            'SELECT name, source, imported_at, word_count FROM builds ORDER BY name')
+        return [dict(zip(('name', 'source', 'imported_at', 'word_count'), row)) for row in rows]
+
+    def build_id(self, build: str) -> int:
+        row = self.conn.execute('SELECT id FROM builds WHERE name = ?', (build,)).fetchone()
+        if row is None:
+            raise KeyError(f"Build not imported: {build}")
+        return row[0]
+
+    def _column(self, sql: str, params: Iterable) -> List[str]:
+        return [row[0] for row in self.conn.execute(sql, tuple(params))]
+
+    def words(self, build: str, parent: Optional[str] = None) -> List[str]:
+        """Words in build order, optionally only the direct children of `parent`"""
+        sql = 'SELECT word FROM words WHERE build_id = ?'
+        params = [self.build_id(build)]
+        if parent is not None:
+            sql += ' AND parent = ?'
+            params.append(parent)
+        return self._column(sql + ' ORDER BY position', params)
+
+    def words_without_traits(self, build: str, parent: Optional[str] = None) -> List[str]:
+        return self.words_without(build, 'trait', parent)
+
+    def words_without(self, build: str, kind: str, parent: Optional[str] = None) -> List[str]:
+        """Words with no edges of `kind` ('trait', 'child', 'acquaintance', ...)"""
+        build_id = self.build_id(build)
+        if kind == 'trait':
+            missing = 'NOT EXISTS (SELECT 1 FROM traits t WHERE t.build_id = w.build_id AND t.word = w.word)'
+            params = [build_id]
+        else:
+            missing = ('NOT EXISTS (SELECT 1 FROM edges e WHERE e.build_id = w.build_id '
+                       'AND e.src = w.word AND e.kind = ?)')
+            params = [kind, build_id]
+        sql = f'SELECT w.word FROM words w WHERE {missing} AND w.build_id = ?'
+        if parent is not None:
+            sql += ' AND w.parent = ?'
+            params.append(parent)
+        return self._column(sql + ' ORDER BY w.position', params)
+
+    def words_by_stages(self, build: str, done: Iterable[str] = (),
+                        not_done: Iterable[str] = ()) -> List[str]:
+        """Words with every stage in `done` completed and every stage in `not_done` not
+
+        A stage missing from a word's `stages` counts as not done.
+        """
+        sql = 'SELECT w.word FROM words w WHERE w.build_id = ?'
+        params: List = [self.build_id(build)]
+        for stage in done:
+            sql += (' AND EXISTS (SELECT 1 FROM stages s WHERE s.build_id = w.build_id '
+                    'AND s.word = w.word AND s.stage = ? AND s.done = 1)')
+            params.append(stage)
+        for stage in not_done:
+            sql += (' AND NOT EXISTS (SELECT 1 FROM stages s WHERE s.build_id = w.build_id '
+                    'AND s.word = w.word AND s.stage = ? AND s.done = 1)')
+            params.append(stage)
+        return self._column(sql + ' ORDER BY w.position', params)
+
+    def incomplete_stages(self, build: str) -> Dict[str, List[str]]:
+        """{word: [stages recorded as not done]} for words with any incomplete stage"""
+        rows = self.conn.execute(
+            'SELECT s.word, s.stage FROM stages s JOIN words w '
+            'ON w.build_id = s.build_id AND w.word = s.word '
+            'WHERE s.build_id = ? AND s.done = 0 ORDER BY w.position, s.stage',
+            (self.build_id(build),))
+        result: Dict[str, List[str]] = {}
+        for word, stage in rows:
+            result.setdefault(word, []).append(stage)
+        return result
+
+    def neighbors(self, build: str, word: str, kind: Optional[str] = None) -> List[str]:
+        sql = 'SELECT dst FROM edges WHERE build_id = ? AND src = ?'
+        params = [self.build_id(build), word]
+        if kind is not None:
+            sql += ' AND kind = ?'
+            params.append(kind)
+        return self._column(sql, params)
+
+    def words_with_trait(self, build: str, trait: str) -> List[str]:
+        return self._column('SELECT word FROM traits WHERE build_id = ? AND trait = ?',
+                            (self.build_id(build), trait))
+
+    def count_by_parent(self, build: str) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT COALESCE(parent, 'root'), COUNT(*) FROM words WHERE build_id = ? "
+            'GROUP BY parent ORDER BY parent', (self.build_id(build),))
+        return dict(rows.fetchall())
+
+    def word_history(self, word: str) -> List[Dict]:
+        """How `word` looked in every imported build"""
+        rows = self.conn.execute(
+            'SELECT b.name, w.parent, '
+            '(SELECT COUNT(*) FROM edges e WHERE e.build_id = w.build_id AND e.src = w.word '
+            "AND e.kind = 'child'), "
+            '(SELECT COUNT(*) FROM traits t WHERE t.build_id = w.build_id AND t.word = w.word), '
+            '(SELECT COUNT(*) FROM edges e WHERE e.build_id = w.build_id AND e.src = w.word '
+            "AND e.kind = 'acquaintance') "
+            'FROM words w JOIN builds b ON b.id = w.build_id WHERE w.word = ? ORDER BY b.name',
+            (word,))
+        keys = ('build', 'parent', 'children', 'traits', 'acquaintances')
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import builds into SQLite and query them')
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite database path')
+    parser.add_argument('--input', default=DEFAULT_BUILD, help='build file to import')
+    parser.add_argument('--name', help='build name (defaults to the containing directory)')
+    parser.add_argument('--archive', action='store_true', help='also import every archived build')
+    args = parser.parse_args()
+
+    with WordDB(args.db) as db:
+        name = args.name or os.path.basename(os.path.dirname(os.path.abspath(args.input)))
+        db.import_build(args.input, name)
+        if args.archive:
+            db.import_archive()
+
+        print("=== WORD DATABASE ===\n")
+        print(f"Database: {args.db}")
+        for build in db.builds():
+            print(f"   {build['name']}: {build['word_count']} words")
+
+        print(f"\nBuild '{name}':")
+        print(f"   Words with no traits: {len(db.words_without_traits(name))}")
+        print(f"   Words with no acquaintances: {len(db.words_without(name, 'acquaintance'))}")
+        print(f"   Words with incomplete stages: {len(db.incomplete_stages(name))}")
+        logged = db.words_by_stages(name, done=['rawLogged'], not_done=['rolesPromoted'])
+        print(f"   rawLogged but not rolesPromoted: {len(logged)}")
+
+
+if __name__ == "__main__":
+    main()